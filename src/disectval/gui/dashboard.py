@@ -3,12 +3,20 @@ Main application window for DisectVal.
 Contains the dashboard with all main features.
 """
 
+import functools
 import logging
+import time
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 try:
+    import tkinter as tk
+    from tkinter import filedialog
     import customtkinter as ctk
+    from PIL import Image, ImageDraw, ImageTk
     CTK_AVAILABLE = True
 except ImportError:
     CTK_AVAILABLE = False
@@ -21,6 +29,205 @@ from .theme import theme
 
 logger = logging.getLogger(__name__)
 
+# Fonts shared by every widget on the dashboard, by family, size and weight
+_CAPTION_FONT = (theme.fonts.family_primary, 11)
+_CAPTION_BOLD_FONT = (theme.fonts.family_primary, 11, "bold")
+_MONO_CAPTION_FONT = (theme.fonts.family_mono, 11)
+_SMALL_FONT = (theme.fonts.family_primary, 12)
+_BODY_FONT = (theme.fonts.family_primary, 13)
+_BODY_LARGE_FONT = (theme.fonts.family_primary, 14)
+_BODY_LARGE_BOLD_FONT = (theme.fonts.family_primary, 14, "bold")
+_ICON_FONT = (theme.fonts.family_primary, 24)
+_HEADING_16_FONT = (theme.fonts.family_heading, 16, "bold")
+_HEADING_18_FONT = (theme.fonts.family_heading, 18, "bold")
+_HEADING_20_FONT = (theme.fonts.family_heading, 20, "bold")
+_HEADING_24_FONT = (theme.fonts.family_heading, 24, "bold")
+_HEADING_28_FONT = (theme.fonts.family_heading, 28, "bold")
+
+# Colors used by every PC check card, resolved once at import
+_CheckCardColors = namedtuple(
+    "_CheckCardColors", "bg name category value desc fix status_muted fix_btn"
+)
+_CHECK_COLORS = _CheckCardColors(
+    bg=theme.colors.bg_tertiary,
+    name=theme.colors.text_primary,
+    category=theme.colors.text_muted,
+    value=theme.colors.text_secondary,
+    desc=theme.colors.text_muted,
+    fix=theme.colors.text_secondary,
+    status_muted=theme.colors.text_muted,
+    fix_btn=theme.colors.accent_secondary,
+)
+
+# How long PC check results are reused before Run System Check re-runs them
+_PC_CHECK_TTL = 30.0
+
+# Status dot color per check status
+_STATUS_COLORS = {
+    CheckStatus.OPTIMAL: theme.colors.status_optimal,
+    CheckStatus.SUBOPTIMAL: theme.colors.status_suboptimal,
+    CheckStatus.CRITICAL: theme.colors.status_critical,
+}
+
+# Grid options of the check card rows that are hidden on optimal results;
+# re-shown with the full options so CTk keeps scaling their padding
+_CHECK_DESC_GRID = {
+    "row": 2, "column": 0, "columnspan": 3, "sticky": "w", "padx": 16, "pady": (8, 0)
+}
+_CHECK_FIX_GRID = {
+    "row": 3, "column": 0, "columnspan": 3, "sticky": "w", "padx": 16, "pady": (8, 0)
+}
+_CHECK_FIX_BTN_GRID = {
+    "row": 4, "column": 0, "columnspan": 3, "sticky": "w", "padx": 16, "pady": (10, 0)
+}
+
+
+@dataclass
+class _CheckCard:
+    """Widgets of one PC check card that change between runs."""
+    frame: "ctk.CTkFrame"
+    status_indicator: "ctk.CTkLabel"
+    name_label: "ctk.CTkLabel"
+    category_label: "ctk.CTkLabel"
+    value_label: "ctk.CTkLabel"
+    desc_label: "ctk.CTkLabel"
+    fix_label: "ctk.CTkLabel"
+    fix_btn: Optional["ctk.CTkButton"] = None
+
+
+# Sidebar button styles, built once and splatted into each button
+_SIDEBAR_BTN_STYLE = {
+    "font": _BODY_LARGE_FONT,
+    "fg_color": "transparent",
+    "hover_color": theme.colors.bg_hover,
+    "text_color": theme.colors.text_secondary,
+    "anchor": "w",
+    "height": 44,
+    "corner_radius": 8,
+}
+_SIDEBAR_BTN_ACTIVE = {
+    "fg_color": theme.colors.bg_tertiary,
+    "text_color": theme.colors.text_primary,
+}
+_SIDEBAR_BTN_INACTIVE = {
+    "fg_color": "transparent",
+    "text_color": theme.colors.text_secondary,
+}
+# Sidebar navigation registry; each page is gated by one permission
+_NavItem = namedtuple("_NavItem", "page_id icon label permission")
+_NAV_REGISTRY = (
+    _NavItem("home", "🏠", "Home", Permission.VIEW_HOME),
+    _NavItem("career", "📊", "Career", Permission.VIEW_CAREER),
+    _NavItem("ranked", "🎯", "Ranked", Permission.VIEW_RANKED),
+    _NavItem("ai_summary", "🤖", "AI Summary", Permission.VIEW_AI_SUMMARY),
+    _NavItem("pc_check", "⚙️", "PC Check", Permission.VIEW_PC_CHECK),
+    _NavItem("admin", "🔧", "Admin", Permission.VIEW_ADMIN_TAB),
+)
+# Button text per page id, pre-rendered from the registry
+_NAV_TEXT = {item.page_id: f"  {item.icon}  {item.label}" for item in _NAV_REGISTRY}
+_LOGOUT_BTN_STYLE = {
+    "font": _BODY_FONT,
+    "fg_color": theme.colors.bg_tertiary,
+    "hover_color": theme.colors.accent_error,
+    "text_color": theme.colors.text_secondary,
+    "height": 40,
+    "corner_radius": 8,
+}
+
+
+@dataclass(frozen=True)
+class _StatCardLine:
+    """One text line drawn on a stat card."""
+    tag: str
+    font: tuple
+    color_key: str
+    y: int
+
+
+_STAT_CARD_LINES = (
+    _StatCardLine("icon", _ICON_FONT, "text_primary", 16),
+    _StatCardLine("value", _HEADING_24_FONT, "text_primary", 52),
+    _StatCardLine("label", _SMALL_FONT, "text_muted", 88),
+)
+
+# Stat card geometry in unscaled pixels, like CTk widget sizes
+_STAT_CARD_WIDTH = 140
+_STAT_CARD_HEIGHT = 120
+_STAT_CARD_PADX = 16
+_STAT_CARD_GAP = 5
+_STAT_CARD_RADIUS = 12
+
+# Canvas tags of the stat card corner images, in _rounded_corner_images order
+_STAT_CARD_CORNERS = ("corner_nw", "corner_ne", "corner_sw", "corner_se")
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_corner_images(
+    radius: int, fill: str, background: str
+) -> Tuple["ImageTk.PhotoImage", ...]:
+    """Render the four card corners once per radius and color."""
+    # Draw oversized and downsample for anti-aliased corners
+    scale = 4
+    size = 2 * radius
+    image = Image.new("RGB", (size * scale, size * scale), background)
+    ImageDraw.Draw(image).ellipse((0, 0, size * scale - 1, size * scale - 1), fill=fill)
+    image = image.resize((size, size), Image.LANCZOS)
+    return tuple(
+        ImageTk.PhotoImage(image.crop(box))
+        for box in (
+            (0, 0, radius, radius),
+            (radius, 0, size, radius),
+            (0, radius, radius, size),
+            (radius, radius, size, size),
+        )
+    )
+
+
+# Career stat cards as (key, label, initial value, icon)
+_CAREER_STATS = (
+    ("games", "Games Analyzed", "0", "📊"),
+    ("kills", "Total Kills", "0", "🎯"),
+    ("deaths", "Total Deaths", "0", "💀"),
+    ("kd", "Avg K/D", "0.00", "📈"),
+)
+
+# Ranked analytics sections as (title, description, icon)
+_RANKED_SECTIONS = (
+    ("Common Mistakes", "Patterns in your deaths and losses", "⚠️"),
+    ("Improvement Areas", "Skills to focus on for ranking up", "📈"),
+    ("Strengths", "What you're doing well", "✅"),
+)
+
+
+def _heading_16(parent, text: str) -> "ctk.CTkLabel":
+    """Create a section heading label."""
+    return ctk.CTkLabel(
+        parent, text=text, font=_HEADING_16_FONT, text_color=theme.colors.text_primary
+    )
+
+
+def _heading_18(parent, text: str) -> "ctk.CTkLabel":
+    """Create a card heading label."""
+    return ctk.CTkLabel(
+        parent, text=text, font=_HEADING_18_FONT, text_color=theme.colors.text_primary
+    )
+
+
+# Page header geometry; the header is a fixed-height frame with placed text
+_PAGE_HEADER_HEIGHT = 72
+_PAGE_SUBTITLE_Y = 44
+
+
+@functools.lru_cache(maxsize=2)
+def _palette(appearance_mode: str) -> dict:
+    """Resolve the stat card colors once per appearance mode."""
+    return {
+        "bg_primary": theme.colors.bg_primary,
+        "bg_secondary": theme.colors.bg_secondary,
+        "text_primary": theme.colors.text_primary,
+        "text_muted": theme.colors.text_muted,
+    }
+
 
 class SidebarButton(ctk.CTkButton if CTK_AVAILABLE else object):
     """Custom sidebar navigation button."""
@@ -32,28 +239,13 @@ class SidebarButton(ctk.CTkButton if CTK_AVAILABLE else object):
         super().__init__(
             parent,
             text=f"  {icon}  {text}" if icon else text,
-            font=(theme.fonts.family_primary, 14),
-            fg_color="transparent",
-            hover_color=theme.colors.bg_hover,
-            text_color=theme.colors.text_secondary,
-            anchor="w",
-            height=44,
-            corner_radius=8,
+            **_SIDEBAR_BTN_STYLE,
             **kwargs
         )
     
     def set_active(self, active: bool) -> None:
         """Set the button as active/inactive."""
-        if active:
-            self.configure(
-                fg_color=theme.colors.bg_tertiary,
-                text_color=theme.colors.text_primary,
-            )
-        else:
-            self.configure(
-                fg_color="transparent",
-                text_color=theme.colors.text_secondary,
-            )
+        self.configure(**(_SIDEBAR_BTN_ACTIVE if active else _SIDEBAR_BTN_INACTIVE))
 
 
 class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
@@ -88,22 +280,78 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
         self.credential_manager = credential_manager
         self.on_logout = on_logout
         self.permission_manager = PermissionManager(user_data['role'])
+        self._refresh_permissions()
         
-        # Initialize utilities
-        self.valorant_detector = ValorantDetector()
-        self.input_controller = InputController(self.valorant_detector)
-        self.windows_checker = WindowsSettingsChecker()
-        
-        # Set input override based on user permission
-        if user_data.get('valorant_input_allowed', False):
-            self.input_controller.set_user_override(True)
+        # Per-user display strings, fixed for the lifetime of the dashboard
+        self._role_text = user_data['role'].value.capitalize()
+        self._role_color = (
+            theme.colors.accent_primary if self._is_developer else theme.colors.text_muted
+        )
+        self._welcome_title = f"Welcome back, {user_data['username']}!"
         
         # Navigation buttons storage
         self.nav_buttons: dict = {}
         self.current_page: str = "home"
+        self._pending_page_after_id: Optional[str] = None
+        
+        # Stat cards by key, refreshed via itemconfigure()
+        self._stat_cards: Dict[str, tk.Canvas] = {}
+        # Every stat card, re-laid out when CTk's widget scaling changes
+        self._all_stat_cards: List[tk.Canvas] = []
+        # Stat cards waiting to be built, one per idle callback
+        self._pending_stat_cards: Deque[tuple] = deque()
+        self._stat_card_after_id: Optional[str] = None
+        
+        # PC check cards by check name, updated in place on re-runs
+        self._check_cards: Dict[str, _CheckCard] = {}
+        # Cards of checks that disappeared, kept for reuse instead of destroyed
+        self._check_card_pool: List[_CheckCard] = []
+        # Wrapping check card labels, resized together when the results resize
+        self._wrap_labels: List["ctk.CTkLabel"] = []
+        self._wraplength = 600
+        self._wrap_dirty = False
+        # Pending idle callback that re-wraps labels and resets the scrollregion
+        self._pc_layout_after_id: Optional[str] = None
+        
+        # Settings checks hit the registry, so they run off the Tk thread
+        self._check_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pc-check")
+        self._check_future: Optional[Future] = None
+        # Summary counts label, reconfigured on every run after the first
+        self._pc_summary_text: Optional["ctk.CTkLabel"] = None
+        # Last results as (time.monotonic() stamp, checks, summary)
+        self._pc_check_cache: Optional[Tuple[float, list, dict]] = None
+        
+        # Built pages by page id, hidden/shown on navigation
+        self._pages: Dict[str, ctk.CTkFrame] = {}
         
         self._setup_ui()
-        self._show_page("home")
+        self._do_show_page("home")
+    
+    @functools.cached_property
+    def valorant_detector(self) -> ValorantDetector:
+        """Valorant process detector, created on first use."""
+        return ValorantDetector()
+    
+    @functools.cached_property
+    def input_controller(self) -> InputController:
+        """Input controller, created on first use."""
+        controller = InputController(self.valorant_detector)
+        
+        # Set input override based on user permission
+        if self.user_data.get('valorant_input_allowed', False):
+            controller.set_user_override(True)
+        
+        return controller
+    
+    @functools.cached_property
+    def windows_checker(self) -> WindowsSettingsChecker:
+        """Windows settings checker, created on first PC check."""
+        return WindowsSettingsChecker()
+    
+    def destroy(self) -> None:
+        """Stop background work and destroy the dashboard."""
+        self._check_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
     
     def _setup_ui(self) -> None:
         """Set up the dashboard UI."""
@@ -124,207 +372,223 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
         self.content_frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
+        
+        # Page builders by page id
+        self._page_builders: Dict[str, Callable[[], ctk.CTkFrame]] = {
+            "home": self._build_home_page,
+            "career": self._build_career_page,
+            "ranked": self._build_ranked_page,
+            "ai_summary": self._build_ai_summary_page,
+            "pc_check": self._build_pc_check_page,
+            "admin": self._build_admin_page,
+        }
     
     def _setup_sidebar(self) -> None:
         """Set up the sidebar navigation."""
+        c = theme.colors
+        
         self.sidebar = ctk.CTkFrame(
             self,
-            fg_color=theme.colors.bg_secondary,
+            fg_color=c.bg_secondary,
             corner_radius=0,
             width=240,
         )
         self.sidebar.grid(row=0, column=0, sticky="nsew")
         self.sidebar.grid_propagate(False)
+        self.sidebar.grid_columnconfigure(0, weight=1)
+        # Navigation row absorbs the free space, pinning Sign Out to the bottom
+        self.sidebar.grid_rowconfigure(3, weight=1)
         
         # Logo section
         logo_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        logo_frame.pack(fill="x", padx=16, pady=20)
+        logo_frame.grid(row=0, column=0, sticky="ew", padx=16, pady=20)
         
         logo_label = ctk.CTkLabel(
             logo_frame,
             text="DisectVal",
-            font=(theme.fonts.family_heading, 24, "bold"),
-            text_color=theme.colors.accent_primary,
+            font=_HEADING_24_FONT,
+            text_color=c.accent_primary,
         )
         logo_label.pack(anchor="w")
         
         version_label = ctk.CTkLabel(
             logo_frame,
             text="v0.1.0 Alpha",
-            font=(theme.fonts.family_primary, 11),
-            text_color=theme.colors.text_muted,
+            font=_CAPTION_FONT,
+            text_color=c.text_muted,
         )
         version_label.pack(anchor="w")
         
         # User info section
         user_frame = ctk.CTkFrame(
             self.sidebar,
-            fg_color=theme.colors.bg_tertiary,
+            fg_color=c.bg_tertiary,
             corner_radius=8,
         )
-        user_frame.pack(fill="x", padx=16, pady=(0, 20))
-        
-        user_inner = ctk.CTkFrame(user_frame, fg_color="transparent")
-        user_inner.pack(fill="x", padx=12, pady=12)
+        user_frame.grid(row=1, column=0, sticky="ew", padx=16, pady=(0, 20))
+        user_frame.grid_columnconfigure(0, weight=1)
         
+        # Labels sit directly on the frame; padding replaces an inner frame
         user_name = ctk.CTkLabel(
-            user_inner,
+            user_frame,
             text=self.user_data['username'],
-            font=(theme.fonts.family_primary, 14, "bold"),
-            text_color=theme.colors.text_primary,
+            font=_BODY_LARGE_BOLD_FONT,
+            text_color=c.text_primary,
         )
-        user_name.pack(anchor="w")
-        
-        role_text = self.user_data['role'].value.capitalize()
-        role_color = theme.colors.accent_primary if self.permission_manager.is_developer() else theme.colors.text_muted
+        user_name.grid(row=0, column=0, sticky="w", padx=12, pady=(12, 0))
         
         user_role = ctk.CTkLabel(
-            user_inner,
-            text=f"● {role_text}",
-            font=(theme.fonts.family_primary, 11),
-            text_color=role_color,
+            user_frame,
+            text=f"● {self._role_text}",
+            font=_CAPTION_FONT,
+            text_color=self._role_color,
         )
-        user_role.pack(anchor="w")
+        user_role.grid(row=1, column=0, sticky="w", padx=12, pady=(0, 12))
         
         # Navigation section
         nav_label = ctk.CTkLabel(
             self.sidebar,
             text="NAVIGATION",
-            font=(theme.fonts.family_primary, 11, "bold"),
-            text_color=theme.colors.text_muted,
+            font=_CAPTION_BOLD_FONT,
+            text_color=c.text_muted,
         )
-        nav_label.pack(fill="x", padx=20, pady=(10, 5), anchor="w")
+        nav_label.grid(row=2, column=0, sticky="w", padx=20, pady=(10, 5))
         
         nav_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        nav_frame.pack(fill="x", padx=8)
-        
-        # Navigation buttons
-        nav_items = [
-            ("home", "🏠", "Home"),
-            ("career", "📊", "Career"),
-            ("ranked", "🎯", "Ranked"),
-            ("ai_summary", "🤖", "AI Summary"),
-            ("pc_check", "⚙️", "PC Check"),
-        ]
+        nav_frame.grid(row=3, column=0, sticky="new", padx=8)
         
-        # Add admin tab if user has permission
-        if self.permission_manager.can_access_admin_features():
-            nav_items.append(("admin", "🔧", "Admin"))
-        
-        for page_id, icon, label in nav_items:
+        # Navigation buttons for the pages this user can view
+        for page_id, text in self._nav_items:
             btn = SidebarButton(
                 nav_frame,
-                text=label,
-                icon=icon,
-                command=lambda p=page_id: self._show_page(p),
+                text=text,
+                command=functools.partial(self._show_page, page_id),
             )
             btn.pack(fill="x", pady=2)
             self.nav_buttons[page_id] = btn
         
-        # Spacer
-        spacer = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        spacer.pack(fill="both", expand=True)
-        
         # Logout button at bottom
-        logout_frame = ctk.CTkFrame(self.sidebar, fg_color="transparent")
-        logout_frame.pack(fill="x", padx=16, pady=20)
-        
         logout_btn = ctk.CTkButton(
-            logout_frame,
+            self.sidebar,
             text="Sign Out",
-            font=(theme.fonts.family_primary, 13),
-            fg_color=theme.colors.bg_tertiary,
-            hover_color=theme.colors.accent_error,
-            text_color=theme.colors.text_secondary,
-            height=40,
-            corner_radius=8,
             command=self.on_logout,
+            **_LOGOUT_BTN_STYLE,
         )
-        logout_btn.pack(fill="x")
+        logout_btn.grid(row=4, column=0, sticky="ew", padx=16, pady=20)
+    
+    def _refresh_permissions(self) -> None:
+        """Resolve the user's permission flags from the permission manager."""
+        pm = self.permission_manager
+        self._is_developer = pm.is_developer()
+        self._can_admin = pm.can_access_admin_features()
+        self._can_train = pm.can_train_ai()
+        self._can_manage_users = pm.has_permission(Permission.MANAGE_USERS)
+        self._can_modify_settings = pm.has_permission(Permission.MODIFY_SETTINGS)
+        
+        # Sidebar items as (page id, button text), already filtered by permission
+        self._nav_items = [
+            (item.page_id, _NAV_TEXT[item.page_id])
+            for item in _NAV_REGISTRY
+            if pm.has_permission(item.permission)
+        ]
     
     def _show_page(self, page_id: str) -> None:
-        """Show a specific page/tab."""
-        # Update button states
+        """Show a specific page/tab, collapsing rapid clicks into one rebuild."""
+        # Update button states immediately so the click feels responsive
         for pid, btn in self.nav_buttons.items():
             btn.set_active(pid == page_id)
         
-        # Clear content area
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        if self._pending_page_after_id is not None:
+            self.after_cancel(self._pending_page_after_id)
+        self._pending_page_after_id = self.after(50, self._do_show_page, page_id)
+    
+    def _do_show_page(self, page_id: str) -> None:
+        """Show a specific page/tab, building it on first visit."""
+        self._pending_page_after_id = None
+        
+        for pid, btn in self.nav_buttons.items():
+            btn.set_active(pid == page_id)
         
         self.current_page = page_id
         
-        # Show the appropriate page
-        if page_id == "home":
-            self._show_home_page()
-        elif page_id == "career":
-            self._show_career_page()
-        elif page_id == "ranked":
-            self._show_ranked_page()
-        elif page_id == "ai_summary":
-            self._show_ai_summary_page()
-        elif page_id == "pc_check":
-            self._show_pc_check_page()
-        elif page_id == "admin":
-            self._show_admin_page()
-    
-    def _show_home_page(self) -> None:
-        """Display the home page."""
+        # Pages are built once and then hidden/shown instead of destroyed
+        page = self._pages.get(page_id)
+        if page is None:
+            builder = self._page_builders.get(page_id)
+            if builder is None:
+                return
+            # Build the whole page unmapped; geometry is solved once when it
+            # is gridded below
+            page = self._pages[page_id] = builder()
+        
+        # grid_forget() also clears CTk's record of the last grid() call, so a
+        # scaling change does not replay it and re-show hidden pages
+        for other in self._pages.values():
+            if other is not page:
+                other.grid_forget()
+        page.grid(row=0, column=0, sticky="nsew")
+    
+    def _new_page(self) -> ctk.CTkFrame:
+        """Create an empty page frame inside the content area."""
+        # Page sections are gridded in a single column, one row each
+        page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        page.grid_columnconfigure(0, weight=1)
+        return page
+    
+    def _build_home_page(self) -> ctk.CTkFrame:
+        """Build the home page."""
+        c = theme.colors
+        
+        page = self._new_page()
+        
         # Page header
-        header = self._create_page_header("Home", "Your gameplay overview and top clips")
-        header.pack(fill="x", pady=(0, 20))
+        header = self._create_page_header(page, "Home", "Your gameplay overview and top clips")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         # Welcome card
         welcome_card = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
+            page,
+            fg_color=c.bg_secondary,
             corner_radius=12,
         )
-        welcome_card.pack(fill="x", pady=(0, 20))
-        
-        welcome_inner = ctk.CTkFrame(welcome_card, fg_color="transparent")
-        welcome_inner.pack(fill="x", padx=24, pady=24)
+        welcome_card.grid(row=1, column=0, sticky="ew", pady=(0, 20))
         
         welcome_title = ctk.CTkLabel(
-            welcome_inner,
-            text=f"Welcome back, {self.user_data['username']}!",
-            font=(theme.fonts.family_heading, 20, "bold"),
-            text_color=theme.colors.text_primary,
+            welcome_card,
+            text=self._welcome_title,
+            font=_HEADING_20_FONT,
+            text_color=c.text_primary,
         )
-        welcome_title.pack(anchor="w")
+        welcome_title.pack(anchor="w", padx=24, pady=(24, 0))
         
         welcome_text = ctk.CTkLabel(
-            welcome_inner,
+            welcome_card,
             text="Start analyzing your gameplay to improve your skills.",
-            font=(theme.fonts.family_primary, 14),
-            text_color=theme.colors.text_secondary,
+            font=_BODY_LARGE_FONT,
+            text_color=c.text_secondary,
         )
-        welcome_text.pack(anchor="w", pady=(5, 0))
+        welcome_text.pack(anchor="w", padx=24, pady=(5, 24))
         
         # Clips section
         clips_card = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
+            page,
+            fg_color=c.bg_secondary,
             corner_radius=12,
         )
-        clips_card.pack(fill="both", expand=True)
+        clips_card.grid(row=2, column=0, sticky="nsew")
+        page.grid_rowconfigure(2, weight=1)
         
         clips_header = ctk.CTkFrame(clips_card, fg_color="transparent")
         clips_header.pack(fill="x", padx=24, pady=(24, 16))
         
-        clips_title = ctk.CTkLabel(
-            clips_header,
-            text="🎬 Top Clips",
-            font=(theme.fonts.family_heading, 16, "bold"),
-            text_color=theme.colors.text_primary,
-        )
+        clips_title = _heading_16(clips_header, "🎬 Top Clips")
         clips_title.pack(side="left")
         
         clips_info = ctk.CTkLabel(
             clips_header,
             text="Top 3 plays from your last 5 games",
-            font=(theme.fonts.family_primary, 12),
-            text_color=theme.colors.text_muted,
+            font=_SMALL_FONT,
+            text_color=c.text_muted,
         )
         clips_info.pack(side="right")
         
@@ -335,150 +599,134 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
         no_clips_label = ctk.CTkLabel(
             clips_content,
             text="No clips yet.\n\nEnable clip recording in Settings to capture your best plays.",
-            font=(theme.fonts.family_primary, 14),
-            text_color=theme.colors.text_muted,
+            font=_BODY_LARGE_FONT,
+            text_color=c.text_muted,
             justify="center",
         )
         no_clips_label.place(relx=0.5, rely=0.5, anchor="center")
+        
+        return page
     
-    def _show_career_page(self) -> None:
-        """Display the career page."""
-        header = self._create_page_header("Career", "Your match history and performance tracking")
-        header.pack(fill="x", pady=(0, 20))
+    def _build_career_page(self) -> ctk.CTkFrame:
+        """Build the career page."""
+        c = theme.colors
+        
+        page = self._new_page()
+        
+        header = self._create_page_header(page, "Career", "Your match history and performance tracking")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         # Stats overview
-        stats_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        stats_frame.pack(fill="x", pady=(0, 20))
+        stats_frame = ctk.CTkFrame(page, fg_color="transparent")
+        stats_frame.grid(row=1, column=0, sticky="ew", pady=(0, 20))
         stats_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
         
-        stats = [
-            ("Games Analyzed", "0", "📊"),
-            ("Total Kills", "0", "🎯"),
-            ("Total Deaths", "0", "💀"),
-            ("Avg K/D", "0.00", "📈"),
-        ]
-        
-        for i, (label, value, icon) in enumerate(stats):
-            card = self._create_stat_card(label, value, icon)
-            card.grid(row=0, column=i, padx=5, sticky="nsew")
+        # Cards stream in after the page skeleton has painted
+        for i, (key, label, value, icon) in enumerate(_CAREER_STATS):
+            self._pending_stat_cards.append((stats_frame, i, key, label, value, icon))
+        self._schedule_stat_cards()
         
         # Match history
         history_card = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
+            page,
+            fg_color=c.bg_secondary,
             corner_radius=12,
         )
-        history_card.pack(fill="both", expand=True)
-        
-        history_inner = ctk.CTkFrame(history_card, fg_color="transparent")
-        history_inner.pack(fill="both", expand=True, padx=24, pady=24)
+        history_card.grid(row=2, column=0, sticky="nsew")
+        page.grid_rowconfigure(2, weight=1)
         
-        history_title = ctk.CTkLabel(
-            history_inner,
-            text="Match History",
-            font=(theme.fonts.family_heading, 16, "bold"),
-            text_color=theme.colors.text_primary,
-        )
-        history_title.pack(anchor="w", pady=(0, 16))
+        history_title = _heading_16(history_card, "Match History")
+        history_title.pack(anchor="w", padx=24, pady=(24, 16))
         
         no_matches = ctk.CTkLabel(
-            history_inner,
+            history_card,
             text="No matches analyzed yet.\n\nStart recording your gameplay to see your match history here.",
-            font=(theme.fonts.family_primary, 14),
-            text_color=theme.colors.text_muted,
+            font=_BODY_LARGE_FONT,
+            text_color=c.text_muted,
             justify="center",
         )
-        no_matches.pack(expand=True)
+        no_matches.pack(expand=True, padx=24, pady=(0, 24))
+        
+        return page
     
-    def _show_ranked_page(self) -> None:
-        """Display the ranked analytics page."""
-        header = self._create_page_header("Ranked Analytics", "In-depth analysis of your ranked performance")
-        header.pack(fill="x", pady=(0, 20))
+    def _build_ranked_page(self) -> ctk.CTkFrame:
+        """Build the ranked analytics page."""
+        c = theme.colors
         
-        # Analysis sections
-        sections = [
-            ("Common Mistakes", "Patterns in your deaths and losses", "⚠️"),
-            ("Improvement Areas", "Skills to focus on for ranking up", "📈"),
-            ("Strengths", "What you're doing well", "✅"),
-        ]
+        page = self._new_page()
+        
+        header = self._create_page_header(page, "Ranked Analytics", "In-depth analysis of your ranked performance")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
-        for title, desc, icon in sections:
+        # Analysis sections
+        for row, (title, desc, icon) in enumerate(_RANKED_SECTIONS, start=1):
             section = ctk.CTkFrame(
-                self.content_frame,
-                fg_color=theme.colors.bg_secondary,
+                page,
+                fg_color=c.bg_secondary,
                 corner_radius=12,
             )
-            section.pack(fill="x", pady=(0, 15))
+            section.grid(row=row, column=0, sticky="ew", pady=(0, 15))
             
-            inner = ctk.CTkFrame(section, fg_color="transparent")
-            inner.pack(fill="x", padx=24, pady=20)
-            
-            section_title = ctk.CTkLabel(
-                inner,
-                text=f"{icon} {title}",
-                font=(theme.fonts.family_heading, 16, "bold"),
-                text_color=theme.colors.text_primary,
-            )
-            section_title.pack(anchor="w")
+            section_title = _heading_16(section, f"{icon} {title}")
+            section_title.pack(anchor="w", padx=24, pady=(20, 0))
             
             section_desc = ctk.CTkLabel(
-                inner,
+                section,
                 text=desc,
-                font=(theme.fonts.family_primary, 13),
-                text_color=theme.colors.text_muted,
+                font=_BODY_FONT,
+                text_color=c.text_muted,
             )
-            section_desc.pack(anchor="w", pady=(5, 10))
+            section_desc.pack(anchor="w", padx=24, pady=(5, 10))
             
             placeholder = ctk.CTkLabel(
-                inner,
+                section,
                 text="Analyze more games to see insights here.",
-                font=(theme.fonts.family_primary, 13),
-                text_color=theme.colors.text_secondary,
+                font=_BODY_FONT,
+                text_color=c.text_secondary,
             )
-            placeholder.pack(anchor="w")
+            placeholder.pack(anchor="w", padx=24, pady=(0, 20))
+        
+        return page
     
-    def _show_ai_summary_page(self) -> None:
-        """Display the AI summary page."""
-        header = self._create_page_header("AI Summary", "AI-generated insights and recommendations")
-        header.pack(fill="x", pady=(0, 20))
+    def _build_ai_summary_page(self) -> ctk.CTkFrame:
+        """Build the AI summary page."""
+        c = theme.colors
+        
+        page = self._new_page()
+        
+        header = self._create_page_header(page, "AI Summary", "AI-generated insights and recommendations")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         # Timeline card
         timeline_card = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
+            page,
+            fg_color=c.bg_secondary,
             corner_radius=12,
         )
-        timeline_card.pack(fill="both", expand=True)
+        timeline_card.grid(row=1, column=0, sticky="nsew")
+        page.grid_rowconfigure(1, weight=1)
         
-        timeline_inner = ctk.CTkFrame(timeline_card, fg_color="transparent")
-        timeline_inner.pack(fill="both", expand=True, padx=24, pady=24)
-        
-        timeline_title = ctk.CTkLabel(
-            timeline_inner,
-            text="🤖 AI Analysis Timeline",
-            font=(theme.fonts.family_heading, 18, "bold"),
-            text_color=theme.colors.text_primary,
-        )
-        timeline_title.pack(anchor="w", pady=(0, 10))
+        timeline_title = _heading_18(timeline_card, "🤖 AI Analysis Timeline")
+        timeline_title.pack(anchor="w", padx=24, pady=(24, 10))
         
         timeline_desc = ctk.CTkLabel(
-            timeline_inner,
+            timeline_card,
             text="Review events from your recent games with AI-generated insights.\n"
                  "The timeline shows deaths, blunders, and suggestions for improvement.",
-            font=(theme.fonts.family_primary, 13),
-            text_color=theme.colors.text_secondary,
+            font=_BODY_FONT,
+            text_color=c.text_secondary,
             justify="left",
         )
-        timeline_desc.pack(anchor="w", pady=(0, 20))
+        timeline_desc.pack(anchor="w", padx=24, pady=(0, 20))
         
         # Placeholder timeline
         placeholder_frame = ctk.CTkFrame(
-            timeline_inner,
-            fg_color=theme.colors.bg_tertiary,
+            timeline_card,
+            fg_color=c.bg_tertiary,
             corner_radius=8,
             height=200,
         )
-        placeholder_frame.pack(fill="x")
+        placeholder_frame.pack(fill="x", padx=24, pady=(0, 24))
         placeholder_frame.pack_propagate(False)
         
         placeholder_text = ctk.CTkLabel(
@@ -486,40 +734,90 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
             text="📝 No timeline data yet.\n\n"
                  "Play games with DisectVal running to generate AI insights.\n"
                  "You can view this mid-game to see your recent deaths and suggestions.",
-            font=(theme.fonts.family_primary, 13),
-            text_color=theme.colors.text_muted,
+            font=_BODY_FONT,
+            text_color=c.text_muted,
             justify="center",
         )
         placeholder_text.place(relx=0.5, rely=0.5, anchor="center")
+        
+        return page
     
-    def _show_pc_check_page(self) -> None:
-        """Display the PC settings check page."""
-        header = self._create_page_header("PC Check", "Optimize your system for best gaming performance")
-        header.pack(fill="x", pady=(0, 20))
+    def _build_pc_check_page(self) -> ctk.CTkFrame:
+        """Build the PC settings check page."""
+        c = theme.colors
+        
+        page = self._new_page()
+        
+        header = self._create_page_header(page, "PC Check", "Optimize your system for best gaming performance")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         # Run checks button
-        btn_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
-        btn_frame.pack(fill="x", pady=(0, 20))
+        btn_frame = ctk.CTkFrame(page, fg_color="transparent")
+        btn_frame.grid(row=1, column=0, sticky="ew", pady=(0, 20))
         
-        run_btn = ctk.CTkButton(
+        self._pc_run_btn = ctk.CTkButton(
             btn_frame,
             text="🔍 Run System Check",
-            font=(theme.fonts.family_primary, 14, "bold"),
-            fg_color=theme.colors.accent_primary,
+            font=_BODY_LARGE_BOLD_FONT,
+            fg_color=c.accent_primary,
             hover_color="#FF5F6D",
             height=44,
             corner_radius=8,
             command=self._run_pc_check,
         )
-        run_btn.pack(side="left")
+        self._pc_run_btn.pack(side="left")
+        
+        rescan_btn = ctk.CTkButton(
+            btn_frame,
+            text="🔄 Re-scan",
+            font=_BODY_LARGE_BOLD_FONT,
+            fg_color=c.bg_tertiary,
+            hover_color=c.bg_hover,
+            height=44,
+            width=120,
+            corner_radius=8,
+            command=functools.partial(self._run_pc_check, force=True),
+        )
+        rescan_btn.pack(side="left", padx=(10, 0))
         
-        # Results area
-        self.pc_check_results = ctk.CTkScrollableFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
+        # Results area - a plain canvas + inner frame so the scrollregion is
+        # recomputed once per idle cycle instead of on every pack()
+        results_card = ctk.CTkFrame(
+            page,
+            fg_color=c.bg_secondary,
             corner_radius=12,
         )
-        self.pc_check_results.pack(fill="both", expand=True)
+        results_card.grid(row=2, column=0, sticky="nsew")
+        page.grid_rowconfigure(2, weight=1)
+        results_card.grid_columnconfigure(0, weight=1)
+        results_card.grid_rowconfigure(0, weight=1)
+        
+        self._pc_canvas = ctk.CTkCanvas(
+            results_card,
+            bg=c.bg_secondary,
+            highlightthickness=0,
+        )
+        self._pc_canvas.grid(row=0, column=0, sticky="nsew", padx=(6, 0), pady=6)
+        
+        scrollbar = ctk.CTkScrollbar(results_card, command=self._pc_canvas.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, 6), pady=6)
+        self._pc_canvas.configure(yscrollcommand=scrollbar.set)
+        
+        self.pc_check_results = ctk.CTkFrame(self._pc_canvas, fg_color=c.bg_secondary)
+        self._pc_window = self._pc_canvas.create_window(
+            0, 0, window=self.pc_check_results, anchor="nw"
+        )
+        
+        # Keep the inner frame as wide as the viewport
+        self._pc_canvas.bind(
+            "<Configure>",
+            lambda e: self._pc_canvas.itemconfigure(self._pc_window, width=e.width),
+        )
+        self.pc_check_results.bind("<Configure>", self._schedule_pc_check_layout, add=True)
+        # Wheel events go to the widget under the pointer, which is usually a
+        # card label, so listen app-wide and filter by ancestry
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self._pc_canvas.bind_all(sequence, self._on_pc_check_scroll, add="+")
         
         # Initial message
         initial_msg = ctk.CTkLabel(
@@ -532,257 +830,420 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
                  "• Graphics settings\n"
                  "• Network optimization\n"
                  "• Storage configuration",
-            font=(theme.fonts.family_primary, 13),
-            text_color=theme.colors.text_secondary,
+            font=_BODY_FONT,
+            text_color=c.text_secondary,
             justify="left",
         )
         initial_msg.pack(padx=24, pady=24, anchor="w")
+        
+        return page
     
-    def _run_pc_check(self) -> None:
-        """Run the PC settings check and display results."""
-        # Clear previous results
+    def _schedule_pc_check_layout(self, event) -> None:
+        """Queue one layout pass after the PC check results resize."""
+        # Subtract the card and inner padding on both sides
+        width = max(200, int(event.width / self._get_widget_scaling()) - 2 * (24 + 16))
+        if width != self._wraplength:
+            self._wraplength = width
+            self._wrap_dirty = True
+        
+        if self._pc_layout_after_id is None:
+            self._pc_layout_after_id = self.after_idle(self._flush_pc_check_layout)
+    
+    def _flush_pc_check_layout(self) -> None:
+        """Re-wrap the check card labels and recompute the scrollregion."""
+        self._pc_layout_after_id = None
+        
+        # Re-wrapping changes card heights, which fires <Configure> again and
+        # brings the scrollregion up to date on the next pass
+        if self._wrap_dirty:
+            self._wrap_dirty = False
+            for label in self._wrap_labels:
+                label.configure(wraplength=self._wraplength)
+        
+        self._pc_canvas.configure(scrollregion=self._pc_canvas.bbox("all"))
+    
+    def _on_pc_check_scroll(self, event) -> None:
+        """Scroll the PC check results when the wheel turns over them."""
+        widget = event.widget
+        while widget is not None and widget is not self._pc_canvas:
+            widget = getattr(widget, "master", None)
+        if widget is None:
+            return
+        
+        # Linux reports the wheel as buttons 4 (up) and 5 (down)
+        up = event.num == 4 or event.delta > 0
+        self._pc_canvas.yview_scroll(-1 if up else 1, "units")
+    
+    def _run_pc_check(self, fix_name: Optional[str] = None, force: bool = False) -> None:
+        """
+        Start the PC settings check in the background.
+        
+        Args:
+            fix_name: Name of a check to auto-fix before re-checking
+            force: Re-run the checks even if recent results are cached
+        """
+        if self._check_future is not None:
+            return
+        
+        # Settings rarely change between clicks; reuse recent results
+        cache = self._pc_check_cache
+        if fix_name is None and not force and cache is not None:
+            stamp, checks, summary = cache
+            if time.monotonic() - stamp < _PC_CHECK_TTL:
+                self._show_pc_check_results(checks, summary)
+                return
+        
+        self._pc_run_btn.configure(state="disabled", text="⏳ Checking...")
+        
+        # Until the first results arrive, show a message in place of the panel
+        if self._pc_summary_text is None:
+            self._show_pc_check_message("⏳ Checking your Windows settings...")
+        
+        self._check_future = self._check_executor.submit(
+            self._collect_pc_checks, self.windows_checker, fix_name
+        )
+        self.after(50, self._poll_pc_check)
+    
+    def _show_pc_check_message(self, text: str) -> None:
+        """Replace the PC check panel contents with a single message."""
+        # Only used before the first results; there are no cards to keep yet
         for widget in self.pc_check_results.winfo_children():
             widget.destroy()
         
-        # Run checks
-        checks = self.windows_checker.run_all_checks()
-        summary = self.windows_checker.get_summary()
-        
-        # Summary header
-        summary_frame = ctk.CTkFrame(
+        message = ctk.CTkLabel(
             self.pc_check_results,
-            fg_color=theme.colors.bg_tertiary,
-            corner_radius=8,
+            text=text,
+            font=_BODY_FONT,
+            text_color=theme.colors.text_secondary,
         )
-        summary_frame.pack(fill="x", padx=24, pady=(24, 16))
+        message.pack(padx=24, pady=24, anchor="w")
+    
+    @staticmethod
+    def _collect_pc_checks(
+        checker: WindowsSettingsChecker, fix_name: Optional[str] = None
+    ) -> Optional[Tuple[list, dict]]:
+        """Apply a fix if requested, then run all checks (worker thread)."""
+        if fix_name is not None and not checker.apply_fix(fix_name):
+            return None
+        
+        checks = checker.run_all_checks()
+        return checks, checker.get_summary()
+    
+    def _poll_pc_check(self) -> None:
+        """Show the check results once the worker has finished."""
+        future = self._check_future
+        if not future.done():
+            self.after(50, self._poll_pc_check)
+            return
         
-        summary_inner = ctk.CTkFrame(summary_frame, fg_color="transparent")
-        summary_inner.pack(fill="x", padx=16, pady=16)
+        self._check_future = None
+        self._pc_run_btn.configure(state="normal", text="🔍 Run System Check")
         
-        summary_title = ctk.CTkLabel(
-            summary_inner,
-            text="📊 Check Summary",
-            font=(theme.fonts.family_heading, 16, "bold"),
-            text_color=theme.colors.text_primary,
-        )
-        summary_title.pack(anchor="w")
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"PC check failed: {e}")
+            if self._pc_summary_text is None:
+                self._show_pc_check_message("⚠ The system check failed. Please try again.")
+            return
         
-        summary_text = ctk.CTkLabel(
-            summary_inner,
-            text=f"Optimal: {summary['optimal']} | "
-                 f"Needs Attention: {summary['suboptimal']} | "
-                 f"Critical: {summary['critical']}",
-            font=(theme.fonts.family_primary, 13),
-            text_color=theme.colors.text_secondary,
+        # None means a requested fix failed; keep the current results
+        if result is not None:
+            self._pc_check_cache = (time.monotonic(), *result)
+            self._show_pc_check_results(*result)
+    
+    def _show_pc_check_results(self, checks: list, summary: dict) -> None:
+        """Display the results of a PC settings check."""
+        c = theme.colors
+        
+        # Pool cards for checks that no longer exist; keep the rest in place
+        names = {check.name for check in checks}
+        for name in list(self._check_cards):
+            if name not in names:
+                card = self._check_cards.pop(name)
+                card.frame.pack_forget()
+                self._check_card_pool.append(card)
+        
+        # Clear everything else (intro or checking message)
+        kept = {card.frame for card in self._check_cards.values()}
+        kept.update(card.frame for card in self._check_card_pool)
+        if self._pc_summary_text is not None:
+            kept.add(self._pc_summary_frame)
+        for widget in self.pc_check_results.winfo_children():
+            if widget not in kept:
+                widget.destroy()
+        
+        summary_text = (
+            f"Optimal: {summary['optimal']} | "
+            f"Needs Attention: {summary['suboptimal']} | "
+            f"Critical: {summary['critical']}"
         )
-        summary_text.pack(anchor="w", pady=(5, 0))
+        if self._pc_summary_text is not None:
+            self._pc_summary_text.configure(text=summary_text)
+        else:
+            # Summary header, built on the first run; cards always pack below it
+            self._pc_summary_frame = ctk.CTkFrame(
+                self.pc_check_results,
+                fg_color=c.bg_tertiary,
+                corner_radius=8,
+            )
+            self._pc_summary_frame.pack(fill="x", padx=24, pady=(24, 16))
+            
+            # Labels sit directly on the frame; padding replaces an inner frame
+            summary_title = _heading_16(self._pc_summary_frame, "📊 Check Summary")
+            summary_title.pack(anchor="w", padx=16, pady=(16, 0))
+            
+            self._pc_summary_text = ctk.CTkLabel(
+                self._pc_summary_frame,
+                text=summary_text,
+                font=_BODY_FONT,
+                text_color=c.text_secondary,
+            )
+            self._pc_summary_text.pack(anchor="w", padx=16, pady=(5, 16))
         
         # Individual check results
         for check in checks:
-            self._create_check_card(check)
+            card = self._check_cards.get(check.name)
+            if card is None:
+                self._check_cards[check.name] = self._acquire_check_card(check)
+            else:
+                self._update_check_card(card, check)
+        
+        # The scrollregion follows the results frame's <Configure>
+        self._pc_canvas.yview_moveto(0)
     
-    def _create_check_card(self, check) -> None:
+    def _acquire_check_card(self, check) -> _CheckCard:
+        """Reuse a pooled check card for a new result, or create one."""
+        if not self._check_card_pool:
+            return self._create_check_card(check)
+        
+        card = self._check_card_pool.pop()
+        card.name_label.configure(text=check.name)
+        card.category_label.configure(text=check.category)
+        self._update_check_card(card, check)
+        card.frame.pack(fill="x", padx=24, pady=4)
+        return card
+    
+    def _create_check_card(self, check) -> _CheckCard:
         """Create a card for a single check result."""
-        # Determine status color
-        status_colors = {
-            CheckStatus.OPTIMAL: theme.colors.status_optimal,
-            CheckStatus.SUBOPTIMAL: theme.colors.status_suboptimal,
-            CheckStatus.CRITICAL: theme.colors.status_critical,
-        }
-        status_color = status_colors.get(check.status, theme.colors.text_muted)
-        
+        # Create every widget first, then lay them out in one pass below
         card = ctk.CTkFrame(
             self.pc_check_results,
-            fg_color=theme.colors.bg_tertiary,
+            fg_color=_CHECK_COLORS.bg,
             corner_radius=8,
         )
-        card.pack(fill="x", padx=24, pady=4)
-        
-        card_inner = ctk.CTkFrame(card, fg_color="transparent")
-        card_inner.pack(fill="x", padx=16, pady=12)
         
         # Header row
-        header_frame = ctk.CTkFrame(card_inner, fg_color="transparent")
-        header_frame.pack(fill="x")
-        
         status_indicator = ctk.CTkLabel(
-            header_frame,
+            card,
             text="●",
-            font=(theme.fonts.family_primary, 14),
-            text_color=status_color,
+            font=_BODY_LARGE_FONT,
         )
-        status_indicator.pack(side="left", padx=(0, 8))
-        
         name_label = ctk.CTkLabel(
-            header_frame,
+            card,
             text=check.name,
-            font=(theme.fonts.family_primary, 14, "bold"),
-            text_color=theme.colors.text_primary,
+            font=_BODY_LARGE_BOLD_FONT,
+            text_color=_CHECK_COLORS.name,
         )
-        name_label.pack(side="left")
-        
         category_label = ctk.CTkLabel(
-            header_frame,
+            card,
             text=check.category,
-            font=(theme.fonts.family_primary, 11),
-            text_color=theme.colors.text_muted,
+            font=_CAPTION_FONT,
+            text_color=_CHECK_COLORS.category,
         )
-        category_label.pack(side="right")
         
         # Current value
-        value_text = f"Current: {check.current_value} | Recommended: {check.recommended_value}"
         value_label = ctk.CTkLabel(
-            card_inner,
-            text=value_text,
-            font=(theme.fonts.family_primary, 12),
-            text_color=theme.colors.text_secondary,
+            card,
+            font=_SMALL_FONT,
+            text_color=_CHECK_COLORS.value,
         )
-        value_label.pack(anchor="w", pady=(8, 0))
         
-        # Expandable description (animated from bottom)
-        if check.status != CheckStatus.OPTIMAL:
-            desc_frame = ctk.CTkFrame(card_inner, fg_color="transparent")
-            desc_frame.pack(fill="x", pady=(8, 0))
-            
-            desc_label = ctk.CTkLabel(
-                desc_frame,
-                text=check.description,
-                font=(theme.fonts.family_primary, 12),
-                text_color=theme.colors.text_muted,
-                wraplength=600,
-                justify="left",
-            )
-            desc_label.pack(anchor="w")
-            
-            # How to fix section
-            fix_label = ctk.CTkLabel(
-                desc_frame,
-                text=f"\n📝 How to fix:\n{check.how_to_fix}",
-                font=(theme.fonts.family_mono, 11),
-                text_color=theme.colors.text_secondary,
-                wraplength=600,
-                justify="left",
+        # Expandable description (animated from bottom), shown when not optimal
+        desc_label = ctk.CTkLabel(
+            card,
+            font=_SMALL_FONT,
+            text_color=_CHECK_COLORS.desc,
+            wraplength=self._wraplength,
+            justify="left",
+        )
+        
+        # How to fix section
+        fix_label = ctk.CTkLabel(
+            card,
+            font=_MONO_CAPTION_FONT,
+            text_color=_CHECK_COLORS.fix,
+            wraplength=self._wraplength,
+            justify="left",
+        )
+        
+        # Auto-fix button, only for users allowed to change settings
+        fix_btn = None
+        if self._can_modify_settings:
+            fix_btn = ctk.CTkButton(
+                card,
+                text="🔧 Apply Fix",
+                font=_SMALL_FONT,
+                fg_color=_CHECK_COLORS.fix_btn,
+                hover_color="#00B894",
+                height=32,
+                width=120,
+                corner_radius=6,
             )
-            fix_label.pack(anchor="w", pady=(8, 0))
-            
-            # Auto-fix button if available
-            if check.can_auto_fix and self.permission_manager.has_permission(Permission.MODIFY_SETTINGS):
-                fix_btn = ctk.CTkButton(
-                    desc_frame,
-                    text="🔧 Apply Fix",
-                    font=(theme.fonts.family_primary, 12),
-                    fg_color=theme.colors.accent_secondary,
-                    hover_color="#00B894",
-                    height=32,
-                    width=120,
-                    corner_radius=6,
-                    command=lambda c=check: self._apply_fix(c),
-                )
-                fix_btn.pack(anchor="w", pady=(10, 0))
+        
+        self._wrap_labels.extend((desc_label, fix_label))
+        
+        # Layout: one grid for the whole card instead of nested packed rows
+        # Padding sits on the cells; the empty last row is the bottom padding,
+        # so it holds no matter which optional rows are hidden
+        card.grid_columnconfigure(1, weight=1)
+        self._scale_check_card_padding(card)
+        status_indicator.grid(row=0, column=0, padx=(16, 8), pady=(12, 0))
+        name_label.grid(row=0, column=1, sticky="w", pady=(12, 0))
+        category_label.grid(row=0, column=2, sticky="e", padx=(0, 16), pady=(12, 0))
+        value_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=16, pady=(8, 0))
+        # Optional rows are gridded by _update_check_card
+        card.pack(fill="x", padx=24, pady=4)
+        
+        widgets = _CheckCard(
+            card, status_indicator, name_label, category_label,
+            value_label, desc_label, fix_label, fix_btn,
+        )
+        self._update_check_card(widgets, check)
+        return widgets
+    
+    def _scale_check_card_padding(self, card: ctk.CTkFrame) -> None:
+        """Size the bottom padding row of a check card for the current scaling."""
+        # CTk scales grid padding but not grid_rowconfigure() sizes
+        card.grid_rowconfigure(5, minsize=round(self._apply_widget_scaling(12)))
+    
+    def _update_check_card(self, card: _CheckCard, check) -> None:
+        """Refresh an existing check card with a new result."""
+        card.status_indicator.configure(
+            text_color=_STATUS_COLORS.get(check.status, _CHECK_COLORS.status_muted)
+        )
+        card.value_label.configure(
+            text=f"Current: {check.current_value} | Recommended: {check.recommended_value}"
+        )
+        
+        # grid_forget() clears CTk's replayed grid() call, so a scaling change
+        # cannot bring hidden rows back
+        if check.status == CheckStatus.OPTIMAL:
+            card.desc_label.grid_forget()
+            card.fix_label.grid_forget()
+            if card.fix_btn is not None:
+                card.fix_btn.grid_forget()
+            return
+        
+        card.desc_label.configure(text=check.description)
+        card.desc_label.grid(**_CHECK_DESC_GRID)
+        card.fix_label.configure(text=f"\n📝 How to fix:\n{check.how_to_fix}")
+        card.fix_label.grid(**_CHECK_FIX_GRID)
+        
+        if card.fix_btn is not None:
+            if check.can_auto_fix:
+                card.fix_btn.configure(command=functools.partial(self._apply_fix, check))
+                card.fix_btn.grid(**_CHECK_FIX_BTN_GRID)
+            else:
+                card.fix_btn.grid_forget()
     
     def _apply_fix(self, check) -> None:
         """Apply an automatic fix for a setting."""
-        success = self.windows_checker.apply_fix(check.name)
-        if success:
-            # Refresh the page to show updated status
-            self._show_pc_check_page()
-    
-    def _show_admin_page(self) -> None:
-        """Display the admin/training page."""
-        if not self.permission_manager.can_access_admin_features():
-            return
+        # The fix and the re-check both touch the registry, so run them off the Tk thread
+        self._run_pc_check(fix_name=check.name)
+    
+    def _build_admin_page(self) -> ctk.CTkFrame:
+        """Build the admin/training page."""
+        c = theme.colors
+        
+        page = self._new_page()
+        
+        if not self._can_admin:
+            return page
+        
+        # Skip the panel entirely when the role has no admin tools
+        if not (self._can_train or self._can_manage_users):
+            no_tools = ctk.CTkLabel(
+                page,
+                text="No admin tools are available for your role.",
+                font=_BODY_LARGE_FONT,
+                text_color=c.text_muted,
+            )
+            no_tools.grid(row=0, column=0, pady=40)
+            return page
         
-        header = self._create_page_header("Admin Panel", "Developer tools and AI training")
-        header.pack(fill="x", pady=(0, 20))
+        header = self._create_page_header(page, "Admin Panel", "Developer tools and AI training")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         # Training section
-        if self.permission_manager.can_train_ai():
+        if self._can_train:
             training_card = ctk.CTkFrame(
-                self.content_frame,
-                fg_color=theme.colors.bg_secondary,
+                page,
+                fg_color=c.bg_secondary,
                 corner_radius=12,
             )
-            training_card.pack(fill="x", pady=(0, 20))
-            
-            training_inner = ctk.CTkFrame(training_card, fg_color="transparent")
-            training_inner.pack(fill="x", padx=24, pady=24)
+            training_card.grid(row=1, column=0, sticky="ew", pady=(0, 20))
             
-            training_title = ctk.CTkLabel(
-                training_inner,
-                text="🎓 AI Training",
-                font=(theme.fonts.family_heading, 18, "bold"),
-                text_color=theme.colors.text_primary,
-            )
-            training_title.pack(anchor="w")
+            training_title = _heading_18(training_card, "🎓 AI Training")
+            training_title.pack(anchor="w", padx=24, pady=(24, 0))
             
             training_desc = ctk.CTkLabel(
-                training_inner,
+                training_card,
                 text="Import gameplay footage for passive AI training.\n"
                      "The AI will analyze videos in the background while you're offline.",
-                font=(theme.fonts.family_primary, 13),
-                text_color=theme.colors.text_secondary,
+                font=_BODY_FONT,
+                text_color=c.text_secondary,
             )
-            training_desc.pack(anchor="w", pady=(5, 15))
+            training_desc.pack(anchor="w", padx=24, pady=(5, 15))
             
             # Import data button
             import_btn = ctk.CTkButton(
-                training_inner,
+                training_card,
                 text="📁 Import Training Data",
-                font=(theme.fonts.family_primary, 14, "bold"),
-                fg_color=theme.colors.accent_secondary,
+                font=_BODY_LARGE_BOLD_FONT,
+                fg_color=c.accent_secondary,
                 hover_color="#00B894",
                 height=44,
                 width=200,
                 corner_radius=8,
                 command=self._import_training_data,
             )
-            import_btn.pack(anchor="w")
+            import_btn.pack(anchor="w", padx=24)
             
             # Training status
-            status_frame = ctk.CTkFrame(training_inner, fg_color="transparent")
-            status_frame.pack(fill="x", pady=(20, 0))
-            
             self.training_status = ctk.CTkLabel(
-                status_frame,
+                training_card,
                 text="Training Status: Idle",
-                font=(theme.fonts.family_primary, 13),
-                text_color=theme.colors.text_muted,
+                font=_BODY_FONT,
+                text_color=c.text_muted,
             )
-            self.training_status.pack(anchor="w")
+            self.training_status.pack(anchor="w", padx=24, pady=(20, 24))
         
         # User management section
-        if self.permission_manager.has_permission(Permission.MANAGE_USERS):
+        if self._can_manage_users:
             users_card = ctk.CTkFrame(
-                self.content_frame,
-                fg_color=theme.colors.bg_secondary,
+                page,
+                fg_color=c.bg_secondary,
                 corner_radius=12,
             )
-            users_card.pack(fill="x")
+            users_card.grid(row=2, column=0, sticky="ew")
             
-            users_inner = ctk.CTkFrame(users_card, fg_color="transparent")
-            users_inner.pack(fill="x", padx=24, pady=24)
-            
-            users_title = ctk.CTkLabel(
-                users_inner,
-                text="👥 User Management",
-                font=(theme.fonts.family_heading, 18, "bold"),
-                text_color=theme.colors.text_primary,
-            )
-            users_title.pack(anchor="w")
+            users_title = _heading_18(users_card, "👥 User Management")
+            users_title.pack(anchor="w", padx=24, pady=(24, 0))
             
             users_desc = ctk.CTkLabel(
-                users_inner,
+                users_card,
                 text="Manage user accounts and permissions.",
-                font=(theme.fonts.family_primary, 13),
-                text_color=theme.colors.text_secondary,
+                font=_BODY_FONT,
+                text_color=c.text_secondary,
             )
-            users_desc.pack(anchor="w", pady=(5, 0))
+            users_desc.pack(anchor="w", padx=24, pady=(5, 24))
+        
+        return page
     
     def _import_training_data(self) -> None:
         """Open dialog to import training data."""
         try:
-            from tkinter import filedialog
-            
             directory = filedialog.askdirectory(
                 title="Select Training Data Directory",
                 mustexist=True,
@@ -797,60 +1258,156 @@ class MainDashboard(ctk.CTkFrame if CTK_AVAILABLE else object):
         except Exception as e:
             logger.error(f"Error selecting training directory: {e}")
     
-    def _create_page_header(self, title: str, subtitle: str) -> ctk.CTkFrame:
+    def _create_page_header(self, parent, title: str, subtitle: str) -> ctk.CTkFrame:
         """Create a page header with title and subtitle."""
-        frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        # Fixed height + place() so the header never re-measures its children
+        frame = ctk.CTkFrame(
+            parent,
+            fg_color="transparent",
+            height=_PAGE_HEADER_HEIGHT,
+        )
         
         title_label = ctk.CTkLabel(
             frame,
             text=title,
-            font=(theme.fonts.family_heading, 28, "bold"),
+            font=_HEADING_28_FONT,
             text_color=theme.colors.text_primary,
         )
-        title_label.pack(anchor="w")
+        title_label.place(x=0, y=0)
         
         subtitle_label = ctk.CTkLabel(
             frame,
             text=subtitle,
-            font=(theme.fonts.family_primary, 14),
+            font=_BODY_LARGE_FONT,
             text_color=theme.colors.text_muted,
         )
-        subtitle_label.pack(anchor="w", pady=(5, 0))
+        subtitle_label.place(x=0, y=_PAGE_SUBTITLE_Y)
         
         return frame
     
-    def _create_stat_card(self, label: str, value: str, icon: str) -> ctk.CTkFrame:
-        """Create a statistics card."""
-        card = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=theme.colors.bg_secondary,
-            corner_radius=12,
-        )
+    def _create_stat_card(
+        self,
+        parent,
+        label: str,
+        value: str,
+        icon: str,
+        key: Optional[str] = None,
+    ) -> tk.Canvas:
+        """
+        Create a statistics card.
         
-        inner = ctk.CTkFrame(card, fg_color="transparent")
-        inner.pack(fill="both", expand=True, padx=16, pady=16)
+        The card is a single canvas: a rounded background built from cached
+        corner images and two rectangles, with the icon, value and caption
+        drawn on top as text items. Sizes follow CTk's widget scaling and are
+        re-applied by _set_scaling.
         
-        icon_label = ctk.CTkLabel(
-            inner,
-            text=icon,
-            font=(theme.fonts.family_primary, 24),
-        )
-        icon_label.pack(anchor="w")
+        When a key is given the card is registered so its value can later be
+        refreshed in place with _update_stat_card.
+        """
+        p = _palette(ctk.get_appearance_mode())
+        card = tk.Canvas(parent, bg=p["bg_primary"], highlightthickness=0)
+        
+        # Resizing only moves these items; the corners are rendered once
+        for tag in _STAT_CARD_CORNERS:
+            card.create_image(0, 0, anchor="nw", tags=tag)
+        for tag in ("fill_h", "fill_v"):
+            card.create_rectangle(0, 0, 0, 0, fill=p["bg_secondary"], width=0, tags=tag)
+        
+        values = {"icon": icon, "value": value, "label": label}
+        create_text = card.create_text
+        for line in _STAT_CARD_LINES:
+            create_text(
+                0,
+                0,
+                text=values[line.tag],
+                fill=p[line.color_key],
+                anchor="nw",
+                tags=line.tag,
+            )
         
-        value_label = ctk.CTkLabel(
-            inner,
-            text=value,
-            font=(theme.fonts.family_heading, 24, "bold"),
-            text_color=theme.colors.text_primary,
+        self._scale_stat_card(card)
+        self._all_stat_cards.append(card)
+        if key is not None:
+            self._stat_cards[key] = card
+        
+        return card
+    
+    def _scale_stat_card(self, card: tk.Canvas) -> None:
+        """Apply the current widget scaling to a stat card's size, text and corners."""
+        p = _palette(ctk.get_appearance_mode())
+        scale = self._apply_widget_scaling
+        radius = round(scale(_STAT_CARD_RADIUS))
+        
+        card.configure(
+            width=round(scale(_STAT_CARD_WIDTH)),
+            height=round(scale(_STAT_CARD_HEIGHT)),
         )
-        value_label.pack(anchor="w", pady=(8, 0))
+        corners = _rounded_corner_images(radius, p["bg_secondary"], p["bg_primary"])
+        for tag, image in zip(_STAT_CARD_CORNERS, corners):
+            card.itemconfigure(tag, image=image)
+        card.bind(
+            "<Configure>",
+            lambda e: self._layout_stat_card_bg(e.widget, radius, e.width, e.height),
+        )
+        # A rescale may not change the card's size, so lay it out now as well
+        if card.winfo_ismapped():
+            self._layout_stat_card_bg(card, radius, card.winfo_width(), card.winfo_height())
         
-        label_text = ctk.CTkLabel(
-            inner,
-            text=label,
-            font=(theme.fonts.family_primary, 12),
-            text_color=theme.colors.text_muted,
+        for line in _STAT_CARD_LINES:
+            card.coords(line.tag, scale(_STAT_CARD_PADX), scale(line.y))
+            card.itemconfigure(line.tag, font=self._scaled_font(line.font))
+        
+        # A plain Tk widget's grid padding is not scaled by CTk either
+        if card.winfo_manager() == "grid":
+            card.grid_configure(padx=round(scale(_STAT_CARD_GAP)))
+    
+    def _set_scaling(self, *args, **kwargs) -> None:
+        """Rescale the dashboard, including sizes CTk does not track itself."""
+        super()._set_scaling(*args, **kwargs)
+        for card in self._all_stat_cards:
+            self._scale_stat_card(card)
+        for card in (*self._check_cards.values(), *self._check_card_pool):
+            self._scale_check_card_padding(card.frame)
+    
+    def _scaled_font(self, font: tuple) -> tuple:
+        """Convert a font tuple to scaled pixels, as CTk does for its widgets."""
+        # A negative size is in pixels; a raw canvas would read it as points
+        family, size, *style = font
+        return (family, -round(self._apply_widget_scaling(size)), *style)
+    
+    @staticmethod
+    def _layout_stat_card_bg(card: tk.Canvas, radius: int, width: int, height: int) -> None:
+        """Move the stat card background pieces to fit the card's size."""
+        card.coords("corner_ne", width - radius, 0)
+        card.coords("corner_sw", 0, height - radius)
+        card.coords("corner_se", width - radius, height - radius)
+        card.coords("fill_h", 0, radius, width, height - radius)
+        card.coords("fill_v", radius, 0, width - radius, height)
+    
+    def _schedule_stat_cards(self) -> None:
+        """Schedule the next pending stat card for the next idle cycle."""
+        if self._stat_card_after_id is None and self._pending_stat_cards:
+            self._stat_card_after_id = self.after_idle(self._build_next_stat_card)
+    
+    def _build_next_stat_card(self) -> None:
+        """Build a single pending stat card, then yield back to the event loop."""
+        self._stat_card_after_id = None
+        if not self._pending_stat_cards:
+            return
+        
+        parent, column, key, label, value, icon = self._pending_stat_cards.popleft()
+        card = self._create_stat_card(parent, label, value, icon, key=key)
+        card.grid(
+            row=0,
+            column=column,
+            padx=round(self._apply_widget_scaling(_STAT_CARD_GAP)),
+            sticky="nsew",
         )
-        label_text.pack(anchor="w")
         
-        return card
+        self._schedule_stat_cards()
+    
+    def _update_stat_card(self, key: str, value: str) -> None:
+        """Update the value shown on an existing stat card."""
+        card = self._stat_cards.get(key)
+        if card is not None:
+            card.itemconfigure("value", text=value)
@@ -4,6 +4,7 @@ Modern UI with encrypted authentication.
 """
 
 import logging
+import threading
 from typing import Callable, Optional
 
 try:
@@ -18,6 +19,9 @@ from .theme import theme
 
 logger = logging.getLogger(__name__)
 
+# Frames cycled on the sign-in button while authentication runs
+_SPINNER_FRAMES = "◐◓◑◒"
+
 
 class LoginPage(ctk.CTkFrame if CTK_AVAILABLE else object):
     """
@@ -52,6 +56,11 @@ class LoginPage(ctk.CTkFrame if CTK_AVAILABLE else object):
         self.credential_manager = credential_manager
         self.on_login_success = on_login_success
         
+        # Background authentication state; the thread is cleared once its
+        # result has been handled, not when it exits
+        self._auth_thread: Optional[threading.Thread] = None
+        self._auth_result: Optional[tuple] = None
+        
         self._setup_ui()
     
     def _setup_ui(self) -> None:
@@ -218,6 +227,10 @@ class LoginPage(ctk.CTkFrame if CTK_AVAILABLE else object):
     
     def _handle_login(self) -> None:
         """Handle login button click."""
+        # Ignore Enter presses while a sign-in is already running
+        if self._auth_thread is not None:
+            return
+        
         username = self.username_entry.get().strip()
         password = self.password_entry.get()
         
@@ -238,54 +251,67 @@ class LoginPage(ctk.CTkFrame if CTK_AVAILABLE else object):
         # Disable button during auth
         self.login_button.configure(state="disabled", text="Signing in...")
         
-        # Attempt authentication
-        self.after(100, lambda: self._authenticate(username, password))
+        # Password hashing is slow, so authenticate off the Tk thread
+        self._auth_result = None
+        self._auth_thread = threading.Thread(
+            target=self._do_auth,
+            args=(username, password),
+            daemon=True,
+        )
+        self._auth_thread.start()
+        self._poll_auth(username)
     
-    def _authenticate(self, username: str, password: str) -> None:
-        """Perform authentication."""
+    def _do_auth(self, username: str, password: str) -> None:
+        """Perform authentication (worker thread)."""
         try:
-            user_data = self.credential_manager.authenticate(username, password)
-            
-            if user_data:
-                logger.info(f"User '{username}' logged in successfully")
-                # Clear sensitive data
-                self.password_entry.delete(0, "end")
-                # Trigger success callback
-                self.on_login_success(user_data)
-            else:
-                self._show_error("Invalid username or password")
-                self.login_button.configure(state="normal", text="Sign In")
-                self.password_entry.delete(0, "end")
-                self.password_entry.focus()
+            self._auth_result = (self.credential_manager.authenticate(username, password), None)
         except Exception as e:
-            logger.error(f"Authentication error: {e}")
+            self._auth_result = (None, e)
+    
+    def _poll_auth(self, username: str, step: int = 0) -> None:
+        """Animate the sign-in button until authentication finishes."""
+        if self._auth_thread.is_alive():
+            frame = _SPINNER_FRAMES[step % len(_SPINNER_FRAMES)]
+            self.login_button.configure(text=f"{frame}  Signing in...")
+            self.after(100, self._poll_auth, username, step + 1)
+            return
+        
+        user_data, error = self._auth_result
+        self._auth_done(username, user_data, error)
+    
+    def _auth_done(
+        self, username: str, user_data: Optional[dict], error: Optional[Exception]
+    ) -> None:
+        """Handle the authentication result on the Tk thread."""
+        self._auth_thread = None
+        
+        if error is not None:
+            logger.error(f"Authentication error: {error}")
             self._show_error("An error occurred. Please try again.")
             self.login_button.configure(state="normal", text="Sign In")
+            return
+        
+        if user_data:
+            logger.info(f"User '{username}' logged in successfully")
+            # Clear sensitive data
+            self.password_entry.delete(0, "end")
+            # Trigger success callback
+            self.on_login_success(user_data)
+        else:
+            self._show_error("Invalid username or password")
+            self.login_button.configure(state="normal", text="Sign In")
+            self.password_entry.delete(0, "end")
+            self.password_entry.focus()
     
     def _show_error(self, message: str) -> None:
         """Display an error message."""
         self.error_label.configure(text=f"⚠ {message}")
         
-        # Shake animation for error feedback
-        self._shake_widget(self.login_card)
+        # Border flash for error feedback
+        self._flash_entry_borders()
     
-    def _shake_widget(self, widget, amplitude: int = 5, duration: int = 300) -> None:
-        """Apply a shake animation to a widget."""
-        original_x = widget.winfo_x()
-        steps = 6
-        delay = duration // steps
-        
-        def shake(step):
-            if step >= steps:
-                widget.place(x=original_x)
-                return
-            
-            offset = amplitude if step % 2 == 0 else -amplitude
-            widget.place(x=original_x + offset)
-            self.after(delay, lambda: shake(step + 1))
-        
-        # Only shake if widget is placed (not grid/pack)
-        # For grid/pack, just visual feedback through color
+    def _flash_entry_borders(self) -> None:
+        """Flash the entry borders in the error color."""
         self.username_entry.configure(border_color=theme.colors.accent_error)
         self.password_entry.configure(border_color=theme.colors.accent_error)
         